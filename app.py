@@ -28,53 +28,67 @@ with st.sidebar:
     runs = st.slider("Monte-Carlo runs", 5, 50, 20)
 
 # --- Core simulation (toy but responsive & consistent) ---
-rng = np.random.default_rng(int(seed))
-
-def clip(x, lo, hi):
-    return float(max(lo, min(hi, x)))
-
-def simulate_one(is_ai: bool):
-    # baseline human detection/recovery depend on severity + anomaly rate
-    base_mttd = 25 + 1.4 * anomaly_rate + 18 * severity
-    base_mttr = 60 + 2.0 * anomaly_rate + 35 * severity + response_delay
-
-    # AI improves detection & recovery
-    if is_ai and ai_enabled:
-        det_gain = 0.15 + 0.70 * ai_sensitivity          # up to ~0.85
-        rec_gain = 0.10 + 0.60 * ai_response_speed        # up to ~0.70
-        if auto_reconfig:
-            rec_gain += 0.10  # extra recovery gain from auto reconfig
-
-        mttd = base_mttd * (1.0 - det_gain)
-        mttr = base_mttr * (1.0 - rec_gain)
-    else:
-        mttd = base_mttd
-        mttr = base_mttr
-
-    # add noise so sliders + runs look real
-    mttd *= rng.normal(1.0, 0.08)
-    mttr *= rng.normal(1.0, 0.10)
-
-    # risk grows with severity, anomaly_rate and slow reaction
-    risk = (severity * 220) + (anomaly_rate * 12) + (mttd * 4.0) + (mttr * 2.5)
-
-    # mission survival score (higher is better)
-    survival = 1000.0 - risk
-    survival = clip(survival, 0.0, 1000.0)
-
-    return mttd, mttr, risk, survival
-
-# Monte Carlo
-rows = []
-for _ in range(int(runs)):
-    hmttd, hmttr, hrisk, hsurv = simulate_one(False)
-    amttd, amttr, arisk, asurv = simulate_one(True)
-    rows.append([hmttd, hmttr, hrisk, hsurv, amttd, amttr, arisk, asurv])
-
-df = pd.DataFrame(rows, columns=[
-    "Human MTTD", "Human MTTR", "Human Risk", "Human Survival",
-    "AI MTTD", "AI MTTR", "AI Risk", "AI Survival"
-])
+@st.cache_data
+def run_monte_carlo(
+    seed: int,
+    runs: int,
+    severity: float,
+    anomaly_rate: int,
+    response_delay: int,
+    ai_enabled: bool,
+    ai_sensitivity: float,
+    ai_response_speed: float,
+    auto_reconfig: bool,
+) -> pd.DataFrame:
+    # cached on the slider values, so reruns that don't change them skip the simulation
+    rng = np.random.default_rng(seed)
+    # all noise in one draw: [human, ai] x [mttd, mttr] x runs
+    noise = rng.standard_normal((2, 2, runs))
+
+    def simulate_vec(is_ai: bool):
+        # baseline human detection/recovery depend on severity + anomaly rate
+        base_mttd = 25 + 1.4 * anomaly_rate + 18 * severity
+        base_mttr = 60 + 2.0 * anomaly_rate + 35 * severity + response_delay
+
+        # AI improves detection & recovery
+        if is_ai and ai_enabled:
+            det_gain = 0.15 + 0.70 * ai_sensitivity          # up to ~0.85
+            rec_gain = 0.10 + 0.60 * ai_response_speed        # up to ~0.70
+            if auto_reconfig:
+                rec_gain += 0.10  # extra recovery gain from auto reconfig
+
+            mttd = base_mttd * (1.0 - det_gain)
+            mttr = base_mttr * (1.0 - rec_gain)
+        else:
+            mttd = base_mttd
+            mttr = base_mttr
+
+        # add noise so sliders + runs look real
+        z_mttd, z_mttr = noise[int(is_ai)]
+        mttd = mttd * (1.0 + 0.08 * z_mttd)
+        mttr = mttr * (1.0 + 0.10 * z_mttr)
+
+        # risk grows with severity, anomaly_rate and slow reaction
+        risk = (severity * 220) + (anomaly_rate * 12) + (mttd * 4.0) + (mttr * 2.5)
+
+        # mission survival score (higher is better)
+        survival = np.clip(1000.0 - risk, 0.0, 1000.0)
+
+        return mttd, mttr, risk, survival
+
+    # Monte Carlo
+    hmttd, hmttr, hrisk, hsurv = simulate_vec(False)
+    amttd, amttr, arisk, asurv = simulate_vec(True)
+
+    return pd.DataFrame({
+        "Human MTTD": hmttd, "Human MTTR": hmttr, "Human Risk": hrisk, "Human Survival": hsurv,
+        "AI MTTD": amttd, "AI MTTR": amttr, "AI Risk": arisk, "AI Survival": asurv,
+    })
+
+df = run_monte_carlo(
+    int(seed), int(runs), severity, anomaly_rate, response_delay,
+    ai_enabled, ai_sensitivity, ai_response_speed, auto_reconfig,
+)
 
 # Aggregate
 human = df[["Human MTTD","Human MTTR","Human Risk","Human Survival"]].mean()
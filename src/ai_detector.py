@@ -1,47 +1,103 @@
 from __future__ import annotations
 import numpy as np
 import pandas as pd
+from joblib import parallel_backend
 from sklearn.ensemble import IsolationForest
-from sklearn.preprocessing import StandardScaler
 
 
 FEATURES = ["battery", "temperature", "signal", "cpu_load"]
 
 
-class AnomalyDetector:
-    def __init__(self, contamination: float = 0.04, random_state: int = 42):
-        self.scaler = StandardScaler()
+class _ThresholdDetector:
+    """
+    Shared predict() for detectors whose score() returns higher = more anomalous.
+    """
+
+    def predict(self, df: pd.DataFrame, threshold: float | None = None) -> np.ndarray:
+        """
+        Returns boolean array: True where anomaly.
+        If threshold not provided, use percentile-based default.
+        """
+        s = self.score(df)
+        if threshold is None:
+            # mark top 4% most anomalous by default
+            threshold = np.quantile(s, 0.96)
+        return s >= threshold
+
+
+class AnomalyDetector(_ThresholdDetector):
+    def __init__(
+        self,
+        contamination: float = 0.04,
+        random_state: int = 42,
+        n_jobs: int | None = None,
+        n_estimators: int = 100,
+        max_samples: int | float | str = "auto",
+    ):
+        # Scores converge well before 100 trees on this 4-D telemetry; "auto" subsamples
+        # min(256, n) rows per tree.
         self.model = IsolationForest(
-            n_estimators=300,
+            n_estimators=n_estimators,
+            max_samples=max_samples,
             contamination=contamination,
             random_state=random_state,
         )
+        # IsolationForest ignores its own n_jobs when scoring; scoring is only
+        # parallelized through a joblib context. Sequential is faster below ~1k
+        # samples, so this is opt-in (fit always keeps sklearn's default).
+        self.n_jobs = n_jobs
         self._is_fit = False
 
     def fit(self, df_normal: pd.DataFrame) -> None:
-        X = df_normal[FEATURES].to_numpy()
-        Xs = self.scaler.fit_transform(X)
+        # float32 is what sklearn's trees work in; passing it directly avoids a cast copy
+        X = df_normal[FEATURES].to_numpy(dtype=np.float32)
+        # Standardize by hand: sklearn's scaler re-validates the input on every call,
+        # which dominates for a (n, 4) matrix
+        self.mean_ = X.mean(axis=0)
+        scale = X.std(axis=0)
+        scale[scale == 0] = 1.0
+        self.inv_scale_ = np.float32(1.0) / scale
+        Xs = (X - self.mean_) * self.inv_scale_
         self.model.fit(Xs)
         self._is_fit = True
 
     def score(self, df: pd.DataFrame) -> np.ndarray:
         if not self._is_fit:
             raise RuntimeError("AnomalyDetector is not fitted. Call fit() first.")
-        X = df[FEATURES].to_numpy()
-        Xs = self.scaler.transform(X)
+        X = df[FEATURES].to_numpy(dtype=np.float32)
+        Xs = (X - self.mean_) * self.inv_scale_
         # IsolationForest: higher = more normal, lower = more anomalous
-        raw = self.model.decision_function(Xs)
+        if self.n_jobs is None:
+            raw = self.model.decision_function(Xs)
+        else:
+            with parallel_backend("threading", n_jobs=self.n_jobs):
+                raw = self.model.decision_function(Xs)
         # Convert to anomaly score: higher = more anomalous
         anomaly_score = -raw
         return anomaly_score
 
-    def predict(self, df: pd.DataFrame, threshold: float | None = None) -> np.ndarray:
-        """
-        Returns boolean array: True where anomaly.
-        If threshold not provided, use percentile-based default.
-        """
-        s = self.score(df)
-        if threshold is None:
-            # mark top 4% most anomalous by default
-            threshold = np.quantile(s, 0.96)
-        return s >= threshold
+
+class ZScoreDetector(_ThresholdDetector):
+    """
+    Lightweight alternative to the IsolationForest detector: robust z-score
+    (median / MAD) per feature, max over features. Same fit/score/predict API.
+    """
+
+    def __init__(self):
+        self._is_fit = False
+
+    def fit(self, df_normal: pd.DataFrame) -> None:
+        X = df_normal[FEATURES].to_numpy(dtype=np.float64)
+        self.median_ = np.median(X, axis=0)
+        # 1.4826 makes the MAD a consistent estimator of the std for normal data
+        mad = np.median(np.abs(X - self.median_), axis=0) * 1.4826
+        mad[mad == 0] = 1.0
+        self.inv_mad_ = 1.0 / mad
+        self._is_fit = True
+
+    def score(self, df: pd.DataFrame) -> np.ndarray:
+        if not self._is_fit:
+            raise RuntimeError("ZScoreDetector is not fitted. Call fit() first.")
+        X = df[FEATURES].to_numpy(dtype=np.float64)
+        # higher = more anomalous
+        return np.max(np.abs(X - self.median_) * self.inv_mad_, axis=1)
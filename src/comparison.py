@@ -2,27 +2,29 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
-from ai_detector import AnomalyDetector
-from controller import diagnose_failure, apply_recovery, mission_damage
+from ai_detector import AnomalyDetector, ZScoreDetector, FEATURES
+from controller import ACTION_NAMES, mission_damage_vec, run_control
 
 
 def run_scenario(
     df: pd.DataFrame,
-    detector: AnomalyDetector,
+    detector: AnomalyDetector | ZScoreDetector,
     human_delay_steps: int = 12,
     ai_enabled: bool = True,
     anomaly_threshold: float | None = None,
+    anomaly_scores: np.ndarray | None = None,
 ) -> dict:
     """
     Simulates an online control loop.
     - If ai_enabled: recovery triggered immediately on anomaly.
     - If not: recovery triggered after human_delay_steps after first anomaly.
+    Pass anomaly_scores to reuse detector scores already computed for df.
     Returns metrics and the resulting telemetry trace.
     """
-    trace = df.copy()
-    n = len(trace)
+    n = len(df)
 
-    anomaly_scores = detector.score(trace)
+    if anomaly_scores is None:
+        anomaly_scores = detector.score(df)
     if anomaly_threshold is None:
         anomaly_threshold = np.quantile(anomaly_scores, 0.96)
     is_anom = anomaly_scores >= anomaly_threshold
@@ -32,26 +34,26 @@ def run_scenario(
     if first_anom is not None:
         trigger_step = first_anom if ai_enabled else min(n - 1, first_anom + human_delay_steps)
 
-    # Apply "recovery" effects from trigger_step onward (simulated)
-    recovered = []
-    damage_series = []
-    action_taken = ["none"] * n
+    # Apply "recovery" effects from trigger_step onward (simulated).
+    # Each step is mitigated independently, so the whole loop runs on column arrays.
+    # df itself is never mutated; only these column copies are
+    cols = {f: df[f].to_numpy(dtype=np.float64, copy=True) for f in FEATURES}
+    battery, temperature, signal, cpu_load = (cols[f] for f in FEATURES)
+    codes = np.zeros(n, dtype=np.int8)
 
-    for i in range(n):
-        row = trace.iloc[i].copy()
+    if trigger_step is not None:
+        codes = run_control(battery, temperature, signal, cpu_load, trigger_step)
 
-        if trigger_step is not None and i >= trigger_step:
-            # diagnose current state, apply recovery
-            failure = diagnose_failure(row)
-            row = apply_recovery(row, failure)
-            action_taken[i] = failure
-            recovered.append(True)
-        else:
-            recovered.append(False)
+    # build the output frame once instead of writing columns into a copy
+    # (non-feature columns of df are carried over in their original order)
+    trace = pd.DataFrame(
+        {c: cols[c] if c in cols else df[c] for c in df.columns},
+        index=df.index,
+    )
+    # decode the int8 action codes to names in one vectorized lookup
+    action_taken = ACTION_NAMES[codes].tolist()
 
-        # write back row (simulate mitigation impact)
-        trace.iloc[i] = row
-        damage_series.append(mission_damage(row))
+    damage_series = mission_damage_vec(battery, temperature, signal, cpu_load)
 
     total_damage = float(np.sum(damage_series))
     survival_score = float(max(0.0, 1000.0 - total_damage))  # simple score
@@ -63,15 +65,26 @@ def run_scenario(
         "total_damage": total_damage,
         "survival_score": survival_score,
         "action_taken": action_taken,
+        "action_codes": codes,
     }
 
 
 def compare_ai_vs_human(
     df_with_failure: pd.DataFrame,
-    detector: AnomalyDetector,
+    detector: AnomalyDetector | ZScoreDetector,
     human_delay_steps: int = 12,
 ) -> dict:
-    ai = run_scenario(df_with_failure, detector, human_delay_steps=human_delay_steps, ai_enabled=True)
-    human = run_scenario(df_with_failure, detector, human_delay_steps=human_delay_steps, ai_enabled=False)
+    # Both scenarios see the same telemetry, so score it only once
+    scores = detector.score(df_with_failure)
+    threshold = np.quantile(scores, 0.96)
+
+    ai = run_scenario(
+        df_with_failure, detector, human_delay_steps=human_delay_steps, ai_enabled=True,
+        anomaly_threshold=threshold, anomaly_scores=scores,
+    )
+    human = run_scenario(
+        df_with_failure, detector, human_delay_steps=human_delay_steps, ai_enabled=False,
+        anomaly_threshold=threshold, anomaly_scores=scores,
+    )
 
     return {"ai": ai, "human": human}
@@ -1,6 +1,12 @@
 from __future__ import annotations
+import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; run_control falls back to NumPy
+    njit = None
+
 
 def diagnose_failure(row: pd.Series) -> str:
     """
@@ -64,3 +70,131 @@ def mission_damage(row: pd.Series) -> float:
     if row["cpu_load"] > 80:
         damage += (row["cpu_load"] - 80) * 0.4
     return damage
+
+
+def mission_damage_vec(
+    battery: np.ndarray,
+    temperature: np.ndarray,
+    signal: np.ndarray,
+    cpu_load: np.ndarray,
+) -> np.ndarray:
+    """
+    Per-step mission_damage over whole telemetry columns.
+    """
+    return (
+        np.maximum(0, 40 - battery) * 0.6  # battery low is bad
+        + np.maximum(0, temperature - 45) * 1.2  # too hot is bad
+        + np.maximum(0, 50 - signal) * 0.7  # comm loss is bad
+        + np.maximum(0, cpu_load - 80) * 0.4  # cpu overload is bad
+    )
+
+
+# Integer encoding of diagnose_failure() outcomes for the array-based control path.
+# Code 0 marks steps where no recovery action was taken.
+ACTION_NAMES = np.array(["none", "thermal", "power", "comm", "cpu", "unknown"])
+
+
+def diagnose_failures(
+    battery: np.ndarray,
+    temperature: np.ndarray,
+    signal: np.ndarray,
+    cpu_load: np.ndarray,
+) -> np.ndarray:
+    """
+    Vectorized diagnose_failure over whole telemetry columns.
+    Returns int8 codes indexing ACTION_NAMES (same priority order as the scalar rules).
+    """
+    return np.select(
+        [temperature > 50, battery < 35, signal < 40, cpu_load > 85],
+        [1, 2, 3, 4],
+        default=5,
+    ).astype(np.int8)
+
+
+def apply_recoveries(
+    battery: np.ndarray,
+    temperature: np.ndarray,
+    signal: np.ndarray,
+    cpu_load: np.ndarray,
+    codes: np.ndarray,
+) -> None:
+    """
+    Vectorized apply_recovery: mutates the telemetry columns in place
+    according to the per-step failure codes (see ACTION_NAMES).
+    """
+    m = codes == 1  # thermal
+    temperature[m] = np.maximum(20.0, temperature[m] - 3.0)
+    cpu_load[m] = np.maximum(0.0, cpu_load[m] - 8.0)
+    battery[m] = np.maximum(0.0, battery[m] - 0.3)
+
+    m = codes == 2  # power
+    cpu_load[m] = np.maximum(0.0, cpu_load[m] - 10.0)
+    battery[m] = np.minimum(100.0, battery[m] + 0.6)
+
+    m = codes == 3  # comm
+    signal[m] = np.minimum(100.0, signal[m] + 12.0)
+    cpu_load[m] = np.minimum(100.0, cpu_load[m] + 2.0)
+    battery[m] = np.maximum(0.0, battery[m] - 0.2)
+
+    m = codes == 4  # cpu
+    cpu_load[m] = np.maximum(0.0, cpu_load[m] - 15.0)
+    battery[m] = np.maximum(0.0, battery[m] - 0.2)
+
+
+def _control_loop(
+    battery: np.ndarray,
+    temperature: np.ndarray,
+    signal: np.ndarray,
+    cpu_load: np.ndarray,
+    trigger_step: int,
+) -> np.ndarray:
+    # diagnose_failure + apply_recovery on scalars, compiled by numba when available
+    n = battery.shape[0]
+    codes = np.zeros(n, dtype=np.int8)
+    for i in range(trigger_step, n):
+        if temperature[i] > 50:
+            codes[i] = 1
+            temperature[i] = max(20.0, temperature[i] - 3.0)
+            cpu_load[i] = max(0.0, cpu_load[i] - 8.0)
+            battery[i] = max(0.0, battery[i] - 0.3)
+        elif battery[i] < 35:
+            codes[i] = 2
+            cpu_load[i] = max(0.0, cpu_load[i] - 10.0)
+            battery[i] = min(100.0, battery[i] + 0.6)
+        elif signal[i] < 40:
+            codes[i] = 3
+            signal[i] = min(100.0, signal[i] + 12.0)
+            cpu_load[i] = min(100.0, cpu_load[i] + 2.0)
+            battery[i] = max(0.0, battery[i] - 0.2)
+        elif cpu_load[i] > 85:
+            codes[i] = 4
+            cpu_load[i] = max(0.0, cpu_load[i] - 15.0)
+            battery[i] = max(0.0, battery[i] - 0.2)
+        else:
+            codes[i] = 5
+    return codes
+
+
+_run_control = njit(cache=True)(_control_loop) if njit is not None else None
+
+
+def run_control(
+    battery: np.ndarray,
+    temperature: np.ndarray,
+    signal: np.ndarray,
+    cpu_load: np.ndarray,
+    trigger_step: int,
+) -> np.ndarray:
+    """
+    Diagnose and recover every step from trigger_step onward, mutating the
+    float64 telemetry columns in place. Returns int8 codes indexing ACTION_NAMES.
+    """
+    if _run_control is not None:
+        return _run_control(battery, temperature, signal, cpu_load, trigger_step)
+
+    codes = np.zeros(battery.shape[0], dtype=np.int8)
+    s = slice(trigger_step, None)
+    codes[s] = diagnose_failures(battery[s], temperature[s], signal[s], cpu_load[s])
+    # slices are views, so the recovery writes land in the full columns
+    apply_recoveries(battery[s], temperature[s], signal[s], cpu_load[s], codes[s])
+    return codes
@@ -1,11 +1,13 @@
 from __future__ import annotations
+import argparse
 import os
 import numpy as np
 import matplotlib.pyplot as plt
 
 from telemetry_simulator import simulate_telemetry, inject_failure
-from ai_detector import AnomalyDetector
+from ai_detector import AnomalyDetector, ZScoreDetector
 from comparison import compare_ai_vs_human
+from controller import mission_damage_vec
 
 
 def ensure_results_dir() -> str:
@@ -17,58 +19,53 @@ def ensure_results_dir() -> str:
 def plot_results(base_df, failed_df, ai_res, human_res, out_dir: str) -> None:
     t = failed_df["t"].to_numpy()
 
+    # One Figure/Axes is reused for all plots; clearing the Axes is much
+    # cheaper than building a fresh Figure each time.
+    fig, ax = plt.subplots()
+
     # 1) Telemetry plot
-    plt.figure()
-    plt.plot(t, failed_df["battery"], label="battery")
-    plt.plot(t, failed_df["temperature"], label="temperature")
-    plt.plot(t, failed_df["signal"], label="signal")
-    plt.plot(t, failed_df["cpu_load"], label="cpu_load")
-    plt.title("Telemetry with Injected Failure")
-    plt.xlabel("t")
-    plt.legend()
-    plt.savefig(os.path.join(out_dir, "telemetry.png"), dpi=160)
-    plt.close()
+    for col in ("battery", "temperature", "signal", "cpu_load"):
+        ax.plot(t, failed_df[col].to_numpy(), label=col)
+    ax.set_title("Telemetry with Injected Failure")
+    ax.set_xlabel("t")
+    ax.legend()
+    fig.savefig(os.path.join(out_dir, "telemetry.png"), dpi=160)
+    ax.clear()
 
     # 2) Anomaly score plot (from AI scenario)
-    plt.figure()
-    plt.plot(t, ai_res["anomaly_scores"], label="anomaly_score")
+    ax.plot(t, ai_res["anomaly_scores"], label="anomaly_score")
     if ai_res["trigger_step"] is not None:
-        plt.axvline(ai_res["trigger_step"], linestyle="--", label="AI trigger")
+        ax.axvline(ai_res["trigger_step"], linestyle="--", label="AI trigger")
     if human_res["trigger_step"] is not None:
-        plt.axvline(human_res["trigger_step"], linestyle="--", label="Human trigger")
-    plt.title("Anomaly Scores and Trigger Time")
-    plt.xlabel("t")
-    plt.legend()
-    plt.savefig(os.path.join(out_dir, "anomaly_scores.png"), dpi=160)
-    plt.close()
+        ax.axvline(human_res["trigger_step"], linestyle="--", label="Human trigger")
+    ax.set_title("Anomaly Scores and Trigger Time")
+    ax.set_xlabel("t")
+    ax.legend()
+    fig.savefig(os.path.join(out_dir, "anomaly_scores.png"), dpi=160)
+    ax.clear()
 
     # 3) Damage comparison
-    # Recompute per-step damage proxy from anomaly scores for visualization simplicity:
-    # We'll approximate damage as normalized anomaly score + penalize battery drop etc.
-    # (The real metric used in code is mission_damage; this plot is illustrative.)
     ai_trace = ai_res["trace"]
     human_trace = human_res["trace"]
 
     def quick_damage(df):
-        dmg = (
-            np.maximum(0, 40 - df["battery"].to_numpy()) * 0.6
-            + np.maximum(0, df["temperature"].to_numpy() - 45) * 1.2
-            + np.maximum(0, 50 - df["signal"].to_numpy()) * 0.7
-            + np.maximum(0, df["cpu_load"].to_numpy() - 80) * 0.4
+        return mission_damage_vec(
+            df["battery"].to_numpy(),
+            df["temperature"].to_numpy(),
+            df["signal"].to_numpy(),
+            df["cpu_load"].to_numpy(),
         )
-        return dmg
 
-    plt.figure()
-    plt.plot(t, np.cumsum(quick_damage(human_trace)), label="Human delayed response (cumulative damage)")
-    plt.plot(t, np.cumsum(quick_damage(ai_trace)), label="AI instant response (cumulative damage)")
-    plt.title("AI vs Human: Cumulative Mission Damage")
-    plt.xlabel("t")
-    plt.legend()
-    plt.savefig(os.path.join(out_dir, "ai_vs_human_damage.png"), dpi=160)
-    plt.close()
+    ax.plot(t, np.cumsum(quick_damage(human_trace)), label="Human delayed response (cumulative damage)")
+    ax.plot(t, np.cumsum(quick_damage(ai_trace)), label="AI instant response (cumulative damage)")
+    ax.set_title("AI vs Human: Cumulative Mission Damage")
+    ax.set_xlabel("t")
+    ax.legend()
+    fig.savefig(os.path.join(out_dir, "ai_vs_human_damage.png"), dpi=160)
+    plt.close(fig)
 
 
-def main():
+def main(detector_name: str = "iforest"):
     out_dir = ensure_results_dir()
 
     # 1) Generate normal telemetry for training
@@ -79,7 +76,10 @@ def main():
     failed_df = inject_failure(mission_df, failure_type="thermal_runaway", start=160, severity=1.2)
 
     # 3) Fit anomaly detector on normal telemetry
-    detector = AnomalyDetector(contamination=0.04, random_state=42)
+    if detector_name == "zscore":
+        detector = ZScoreDetector()
+    else:
+        detector = AnomalyDetector(contamination=0.04, random_state=42)
     detector.fit(train_df)
 
     # 4) Compare AI vs Human delay
@@ -100,4 +100,11 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="AstraGuard MVP simulation")
+    parser.add_argument(
+        "--detector",
+        choices=["iforest", "zscore"],
+        default="iforest",
+        help="anomaly detector: Isolation Forest (default) or median/MAD z-score",
+    )
+    main(parser.parse_args().detector)
@@ -21,17 +21,37 @@ def simulate_telemetry(
     rng = np.random.default_rng(seed)
     t = np.arange(n_steps)
 
-    # Base trends + periodic components
-    battery = 100 - 0.02 * t + 0.6 * np.sin(t / 30.0)
-    temperature = 35 + 0.8 * np.sin(t / 18.0) + 0.5 * np.cos(t / 50.0)
-    signal = 85 + 3.0 * np.sin(t / 40.0) - 0.02 * (t / 10.0)
-    cpu = 35 + 8.0 * np.sin(t / 10.0) + 5.0 * np.cos(t / 17.0)
-
-    # Add noise
-    battery += rng.normal(0, 0.25 * noise_scale, size=n_steps)
-    temperature += rng.normal(0, 0.35 * noise_scale, size=n_steps)
-    signal += rng.normal(0, 0.9 * noise_scale, size=n_steps)
-    cpu += rng.normal(0, 1.2 * noise_scale, size=n_steps)
+    # Base trends + periodic components, accumulated in place to limit temporaries
+    battery = np.sin(t / 30.0)
+    battery *= 0.6
+    battery -= 0.02 * t
+    battery += 100
+
+    temperature = np.sin(t / 18.0)
+    temperature *= 0.8
+    temperature += 0.5 * np.cos(t / 50.0)
+    temperature += 35
+
+    signal = np.sin(t / 40.0)
+    signal *= 3.0
+    signal -= 0.002 * t
+    signal += 85
+
+    cpu = np.sin(t / 10.0)
+    cpu *= 8.0
+    cpu += 5.0 * np.cos(t / 17.0)
+    cpu += 35
+
+    # Add noise (one RNG call for all four columns; same stream as drawing them in turn)
+    noise = rng.standard_normal((4, n_steps))
+    battery += 0.25 * noise_scale * noise[0]
+    temperature += 0.35 * noise_scale * noise[1]
+    signal += 0.9 * noise_scale * noise[2]
+    cpu += 1.2 * noise_scale * noise[3]
+
+    # Clip to realistic bounds (in place, before the frame is built)
+    for arr in (battery, signal, cpu):
+        np.clip(arr, 0, 100, out=arr)
 
     df = pd.DataFrame(
         {
@@ -43,11 +63,6 @@ def simulate_telemetry(
         }
     )
 
-    # Clip to realistic bounds
-    df["battery"] = df["battery"].clip(0, 100)
-    df["signal"] = df["signal"].clip(0, 100)
-    df["cpu_load"] = df["cpu_load"].clip(0, 100)
-
     return df
 
 
@@ -65,28 +80,38 @@ def inject_failure(
       - "power_drain": battery drops faster, cpu may dip
       - "comm_drop": signal decreases sharply, cpu rises
     """
-    out = df.copy()
-    n = len(out)
+    n = len(df)
     start = max(0, min(start, n - 1))
 
-    idx = np.arange(start, n)
-    k = idx - start
+    # Work on plain arrays; pandas .loc setitem is far slower than slice arithmetic
+    k = np.arange(n - start)
+    battery = df["battery"].to_numpy(dtype=np.float64, copy=True)
+    temperature = df["temperature"].to_numpy(dtype=np.float64, copy=True)
+    signal = df["signal"].to_numpy(dtype=np.float64, copy=True)
+    cpu = df["cpu_load"].to_numpy(dtype=np.float64, copy=True)
 
     if failure_type == "thermal_runaway":
-        out.loc[idx, "temperature"] += severity * (0.05 * k + 0.8 * np.sin(k / 7.0))
-        out.loc[idx, "cpu_load"] += severity * (0.03 * k)
+        temperature[start:] += severity * (0.05 * k + 0.8 * np.sin(k / 7.0))
+        cpu[start:] += severity * (0.03 * k)
     elif failure_type == "power_drain":
-        out.loc[idx, "battery"] -= severity * (0.06 * k + 0.4 * np.abs(np.sin(k / 10.0)))
-        out.loc[idx, "cpu_load"] -= severity * (0.01 * k)
+        battery[start:] -= severity * (0.06 * k + 0.4 * np.abs(np.sin(k / 10.0)))
+        cpu[start:] -= severity * (0.01 * k)
     elif failure_type == "comm_drop":
-        out.loc[idx, "signal"] -= severity * (0.18 * k + 3.0 * np.abs(np.sin(k / 6.0)))
-        out.loc[idx, "cpu_load"] += severity * (0.02 * k)
+        signal[start:] -= severity * (0.18 * k + 3.0 * np.abs(np.sin(k / 6.0)))
+        cpu[start:] += severity * (0.02 * k)
     else:
         raise ValueError(f"Unknown failure_type: {failure_type}")
 
     # Re-clip
-    out["battery"] = out["battery"].clip(0, 100)
-    out["signal"] = out["signal"].clip(0, 100)
-    out["cpu_load"] = out["cpu_load"].clip(0, 100)
+    for arr in (battery, signal, cpu):
+        np.clip(arr, 0, 100, out=arr)
+
+    # Assemble the result in one go rather than copying df and overwriting columns
+    # (every other column of df is carried over in its original order)
+    updated = {"battery": battery, "temperature": temperature, "signal": signal, "cpu_load": cpu}
+    out = pd.DataFrame(
+        {c: updated[c] if c in updated else df[c] for c in df.columns},
+        index=df.index,
+    )
 
     return out